@@ -0,0 +1,50 @@
+"""
+Shared fixtures for the High School Management System API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app, activities
+
+
+# Original participants captured once at import; tuples are safe to share
+_BASELINE = {
+    activity_name: tuple(activity["participants"])
+    for activity_name, activity in activities.items()
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app, shared across the session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request):
+    """Restore activity participants after each test not marked readonly"""
+    yield
+
+    if request.node.get_closest_marker("readonly"):
+        return
+
+    for activity_name, participants in _BASELINE.items():
+        activities[activity_name]["participants"][:] = participants
+
+
+@pytest.fixture
+def signed_up(request):
+    """Sign up a student directly in the activities dict, bypassing HTTP"""
+    def _signup(activity, email):
+        participants = activities[activity]["participants"]
+        participants.append(email)
+
+        def _cleanup():
+            if email in participants:
+                participants.remove(email)
+
+        request.addfinalizer(_cleanup)
+        return email
+
+    return _signup
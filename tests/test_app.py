@@ -2,38 +2,32 @@
 Tests for the High School Management System FastAPI application
 """
 
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from fastapi import HTTPException
+from src.app import activities, get_activities, signup_for_activity
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+ACTIVITIES = [
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Soccer Team",
+    "Swimming Club",
+    "Art Studio",
+    "Drama Club",
+    "Debate Team",
+    "Science Olympiad"
+]
 
+EXPECTED_ACTIVITIES = frozenset(ACTIVITIES)
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        activity_name: {
-            "description": activity["description"],
-            "schedule": activity["schedule"],
-            "max_participants": activity["max_participants"],
-            "participants": activity["participants"].copy()
-        }
-        for activity_name, activity in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state
-    for activity_name, activity_data in original_activities.items():
-        activities[activity_name]["participants"] = activity_data["participants"].copy()
+SIGNUP_URL = {name: f"/activities/{quote(name)}/signup" for name in ACTIVITIES}
+UNREGISTER_URL = {name: f"/activities/{quote(name)}/unregister" for name in ACTIVITIES}
 
 
+@pytest.mark.readonly
 class TestRoot:
     """Tests for the root endpoint"""
     
@@ -44,6 +38,7 @@ class TestRoot:
         assert response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.readonly
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
@@ -56,73 +51,21 @@ class TestGetActivities:
         """Test that GET /activities returns a dictionary"""
         response = client.get("/activities")
         assert isinstance(response.json(), dict)
-    
-    def test_get_activities_contains_expected_activities(self, client):
-        """Test that GET /activities contains expected activity names"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        expected_activities = [
-            "Chess Club",
-            "Programming Class",
-            "Gym Class",
-            "Soccer Team",
-            "Swimming Club",
-            "Art Studio",
-            "Drama Club",
-            "Debate Team",
-            "Science Olympiad"
-        ]
-        
-        for activity in expected_activities:
-            assert activity in data
-    
-    def test_activity_structure(self, client):
-        """Test that each activity has the expected structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity in data.items():
-            assert "description" in activity
-            assert "schedule" in activity
-            assert "max_participants" in activity
-            assert "participants" in activity
-            assert isinstance(activity["participants"], list)
 
 
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_for_existing_activity(self, client):
-        """Test successful signup for an existing activity"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
-        )
-        assert response.status_code == 200
-        assert "Signed up newstudent@mergington.edu for Chess Club" in response.json()["message"]
-    
     def test_signup_adds_participant_to_activity(self, client):
         """Test that signup actually adds the participant to the activity"""
         email = "test@mergington.edu"
         client.post(
-            "/activities/Chess Club/signup",
+            SIGNUP_URL["Chess Club"],
             params={"email": email}
         )
         
         # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
-    
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signup for a non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Fake Club/signup",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
+        assert email in activities["Chess Club"]["participants"]
     
     def test_duplicate_signup(self, client):
         """Test that duplicate signup returns 400"""
@@ -130,91 +73,48 @@ class TestSignupForActivity:
         
         # First signup should succeed
         response = client.post(
-            "/activities/Chess Club/signup",
+            SIGNUP_URL["Chess Club"],
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Second signup should fail
         response = client.post(
-            "/activities/Chess Club/signup",
+            SIGNUP_URL["Chess Club"],
             params={"email": email}
         )
         assert response.status_code == 400
         assert response.json()["detail"] == "Student already signed up for this activity"
-    
-    def test_signup_with_existing_participant(self, client):
-        """Test that signing up with an already registered email fails"""
-        # Try to sign up with an email that's already in the initial data
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "michael@mergington.edu"}
-        )
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student already signed up for this activity"
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_from_activity(self, client):
+    def test_unregister_from_activity(self, client, signed_up):
         """Test successful unregistration from an activity"""
         # First, sign up a student
-        email = "unregister@mergington.edu"
-        client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
+        email = signed_up("Chess Club", "unregister@mergington.edu")
         
         # Then unregister
         response = client.delete(
-            "/activities/Chess Club/unregister",
+            UNREGISTER_URL["Chess Club"],
             params={"email": email}
         )
         assert response.status_code == 200
         assert f"Unregistered {email} from Chess Club" in response.json()["message"]
     
-    def test_unregister_removes_participant(self, client):
+    def test_unregister_removes_participant(self, client, signed_up):
         """Test that unregister actually removes the participant"""
-        email = "remove@mergington.edu"
-        
-        # Sign up
-        client.post(
-            "/activities/Programming Class/signup",
-            params={"email": email}
-        )
-        
-        # Verify participant was added
-        response = client.get("/activities")
-        assert email in response.json()["Programming Class"]["participants"]
+        email = signed_up("Programming Class", "remove@mergington.edu")
         
         # Unregister
         client.delete(
-            "/activities/Programming Class/unregister",
+            UNREGISTER_URL["Programming Class"],
             params={"email": email}
         )
         
         # Verify participant was removed
-        response = client.get("/activities")
-        assert email not in response.json()["Programming Class"]["participants"]
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregister from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/Fake Club/unregister",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-    
-    def test_unregister_not_signed_up(self, client):
-        """Test unregister when student is not signed up returns 400"""
-        response = client.delete(
-            "/activities/Chess Club/unregister",
-            params={"email": "notsignedup@mergington.edu"}
-        )
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student is not signed up for this activity"
+        assert email not in activities["Programming Class"]["participants"]
     
     def test_unregister_existing_participant(self, client):
         """Test unregistering an existing participant from initial data"""
@@ -222,14 +122,64 @@ class TestUnregisterFromActivity:
         email = "michael@mergington.edu"
         
         response = client.delete(
-            "/activities/Chess Club/unregister",
+            UNREGISTER_URL["Chess Club"],
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Verify he was removed
-        response = client.get("/activities")
-        assert email not in response.json()["Chess Club"]["participants"]
+        assert email not in activities["Chess Club"]["participants"]
+
+
+class TestEndpointResponses:
+    """Table-driven checks of the HTTP responses returned by the mutating endpoints"""
+    
+    @pytest.mark.parametrize("method,path,email,expected_status,field,expected_text", [
+        ("post", SIGNUP_URL["Chess Club"], "newstudent@mergington.edu",
+         200, "message", "Signed up newstudent@mergington.edu for Chess Club"),
+        ("post", f"/activities/{quote('Fake Club')}/signup", "student@mergington.edu",
+         404, "detail", "Activity not found"),
+        ("delete", UNREGISTER_URL["Chess Club"], "notsignedup@mergington.edu",
+         400, "detail", "Student is not signed up for this activity"),
+        ("delete", f"/activities/{quote('Fake Club')}/unregister", "student@mergington.edu",
+         404, "detail", "Activity not found"),
+    ], ids=[
+        "signup-success",
+        "signup-unknown-activity",
+        "unregister-not-signed-up",
+        "unregister-unknown-activity",
+    ])
+    def test_endpoint_response(self, client, method, path, email, expected_status, field, expected_text):
+        """Test the status code and JSON message/detail returned over HTTP"""
+        response = getattr(client, method)(path, params={"email": email})
+        assert response.status_code == expected_status
+        assert expected_text in response.json()[field]
+
+
+@pytest.mark.readonly
+class TestRouteHandlers:
+    """Tests that call the route handler functions directly, without HTTP"""
+    
+    def test_get_activities_contains_expected_activities(self):
+        """Test that get_activities returns the expected activity names"""
+        assert EXPECTED_ACTIVITIES <= get_activities().keys()
+    
+    @pytest.mark.parametrize("activity", list(activities))
+    def test_activity_structure(self, activity):
+        """Test that each in-memory activity returned by get_activities has the expected fields"""
+        data = get_activities()[activity]
+        assert "description" in data
+        assert "schedule" in data
+        assert "max_participants" in data
+        assert "participants" in data
+        assert isinstance(data["participants"], list)
+    
+    def test_signup_existing_participant_raises(self):
+        """Test that signup_for_activity raises 400 for an already registered email"""
+        with pytest.raises(HTTPException) as exc:
+            signup_for_activity("Chess Club", "michael@mergington.edu")
+        assert exc.value.status_code == 400
+        assert exc.value.detail == "Student already signed up for this activity"
 
 
 class TestIntegration:
@@ -241,30 +191,27 @@ class TestIntegration:
         activity = "Drama Club"
         
         # Get initial participant count
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
         response = client.post(
-            f"/activities/{activity}/signup",
+            SIGNUP_URL[activity],
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Verify count increased
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count + 1
+        assert len(activities[activity]["participants"]) == initial_count + 1
         
         # Unregister
         response = client.delete(
-            f"/activities/{activity}/unregister",
+            UNREGISTER_URL[activity],
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Verify count back to initial
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count
+        assert len(activities[activity]["participants"]) == initial_count
     
     def test_multiple_activities_signup(self, client):
         """Test signing up for multiple different activities"""
@@ -273,13 +220,11 @@ class TestIntegration:
         
         for activity in activities_list:
             response = client.post(
-                f"/activities/{activity}/signup",
+                SIGNUP_URL[activity],
                 params={"email": email}
             )
             assert response.status_code == 200
         
         # Verify student is in all activities
-        response = client.get("/activities")
-        data = response.json()
         for activity in activities_list:
-            assert email in data[activity]["participants"]
+            assert email in activities[activity]["participants"]